@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import csv
+import operator
+import random
+import re
+import time
+import requests
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configuration
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+OWNER = "EvezArt"
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 2  # seconds
+MAX_BACKOFF = 60  # seconds
+# Transient gateway errors from api.github.com that are worth retrying
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+# Secondary rate limits come back as 403 with this phrase in the body
+RATE_LIMIT_MESSAGE = re.compile(rb"rate limit", re.IGNORECASE)
+# GraphQL error types returned with HTTP 200 that clear up after waiting
+RETRYABLE_ERROR_TYPES = frozenset({"RATE_LIMITED"})
+# Reports are written a page at a time; a large buffer keeps flushes to a handful of syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+CSV_FIELDNAMES = (
+    "name",
+    "full_name",
+    "owner_login",
+    "is_private",
+    "url",
+    "description",
+    "default_branch",
+    "created_at",
+    "updated_at",
+    "pushed_at",
+    "stargazer_count",
+    "fork_count",
+    "disk_usage",
+    "topics",
+    "license",
+    "primary_language",
+)
+CSV_ROW = operator.itemgetter(*CSV_FIELDNAMES)
+# Scalar fields of a repository node; GraphQL always returns every selected key
+REPO_FIELDS = operator.itemgetter(
+    "name",
+    "isPrivate",
+    "url",
+    "description",
+    "createdAt",
+    "updatedAt",
+    "pushedAt",
+    "stargazerCount",
+    "forkCount",
+    "diskUsage",
+)
+# Whitespace is collapsed once at import so each page uploads a compact query
+REPOSITORIES_QUERY = " ".join("""
+query($login: String!, $after: String, $isFork: Boolean, $isArchived: Boolean) {
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $after, isFork: $isFork, isArchived: $isArchived) {
+      nodes {
+        name
+        owner {
+          login
+        }
+        isPrivate
+        url
+        description
+        defaultBranchRef {
+          name
+        }
+        createdAt
+        updatedAt
+        pushedAt
+        stargazerCount
+        forkCount
+        diskUsage
+        repositoryTopics(first: 20) {
+          nodes {
+            topic {
+              name
+            }
+          }
+        }
+        licenseInfo {
+          name
+        }
+        primaryLanguage {
+          name
+        }
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+    }
+  }
+}
+""".split())
+
+# time.monotonic() deadline before which no request is sent; pushed out
+# whenever GitHub tells us the rate limit is exhausted
+resume_requests_at = 0.0
+
+def loads_json(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def dumps_json(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON, using orjson when it is installed.
+    
+    Output is compact unless pretty is set, which indents by two spaces.
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def env_flag(name: str, default: bool = True) -> bool:
+    """Read a boolean flag from the environment; unset or empty means default."""
+    value = os.environ.get(name, "").strip().lower()
+    if not value:
+        return default
+    return value not in ("0", "false", "no")
+
+def get_headers(token: Optional[str]) -> Dict[str, str]:
+    """Build headers for GitHub API requests."""
+    headers = {
+        "Content-Type": "application/json",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+def create_session(token: Optional[str]) -> requests.Session:
+    """Create a session that keeps one connection open across all API requests."""
+    session = requests.Session()
+    session.headers.update(get_headers(token))
+    return session
+
+def defer_requests(seconds: float):
+    """Hold back all following requests for at least the given number of seconds."""
+    global resume_requests_at
+    resume_requests_at = max(resume_requests_at, time.monotonic() + seconds)
+
+def wait_for_resume():
+    """Sleep until any deferral from a rate limit has elapsed."""
+    delay = resume_requests_at - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+def backoff_delay(previous: float) -> float:
+    """Decorrelated jitter backoff: grow randomly from the previous delay, capped at MAX_BACKOFF."""
+    return min(MAX_BACKOFF, random.uniform(RETRY_BACKOFF_BASE, previous * 3))
+
+def retry_delay(response: requests.Response, backoff: float) -> float:
+    """Return how many seconds to wait before retrying a failed response.
+    
+    Prefers Retry-After (secondary limits), then the X-RateLimit-Reset epoch
+    once the primary limit is used up, then the given backoff.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        return int(retry_after)
+    reset = response.headers.get("X-RateLimit-Reset")
+    if reset and response.headers.get("X-RateLimit-Remaining") == "0":
+        return max(1, int(reset) - int(time.time()))
+    return backoff
+
+def execute_graphql_query(query: str, variables: Dict[str, Any], session: requests.Session) -> Dict[str, Any]:
+    """Execute a GraphQL query with retry logic."""
+    backoff = RETRY_BACKOFF_BASE
+    for attempt in range(MAX_RETRIES + 1):
+        wait_for_resume()
+        try:
+            response = session.post(
+                GITHUB_GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                timeout=30
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"Error: Request failed: {e}")
+            if attempt == MAX_RETRIES:
+                print(f"Error: Max retries exceeded")
+                sys.exit(1)
+            backoff = backoff_delay(backoff)
+            print(f"Retrying after {backoff:.1f} seconds... (attempt {attempt + 1}/{MAX_RETRIES})")
+            time.sleep(backoff)
+            continue
+        
+        # Handle rate limiting
+        if response.status_code == 429 or (response.status_code == 403 and RATE_LIMIT_MESSAGE.search(response.content)):
+            if attempt == MAX_RETRIES:
+                print(f"Error: Max retries exceeded for rate limiting")
+                sys.exit(1)
+            backoff = backoff_delay(backoff)
+            retry_after = retry_delay(response, backoff)
+            print(f"Rate limited. Retrying after {retry_after:.0f} seconds... (attempt {attempt + 1}/{MAX_RETRIES})")
+            defer_requests(retry_after)
+            continue
+        
+        # Retry transient server errors
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            if attempt == MAX_RETRIES:
+                print(f"Error: Max retries exceeded for HTTP {response.status_code}")
+                sys.exit(1)
+            backoff = backoff_delay(backoff)
+            wait = retry_delay(response, backoff)
+            print(f"Server error HTTP {response.status_code}. Retrying after {wait:.1f} seconds... (attempt {attempt + 1}/{MAX_RETRIES})")
+            time.sleep(wait)
+            continue
+        
+        # Handle other 4xx/5xx errors
+        if response.status_code >= 400:
+            print(f"Error: HTTP {response.status_code}")
+            print(f"Response: {response.text}")
+            sys.exit(1)
+        
+        result = loads_json(response.content)
+        
+        # Check for GraphQL errors
+        if "errors" in result:
+            if attempt < MAX_RETRIES and any(error.get("type") in RETRYABLE_ERROR_TYPES for error in result["errors"]):
+                backoff = backoff_delay(backoff)
+                retry_after = retry_delay(response, backoff)
+                print(f"GraphQL rate limited. Retrying after {retry_after:.0f} seconds... (attempt {attempt + 1}/{MAX_RETRIES})")
+                defer_requests(retry_after)
+                continue
+            print(f"GraphQL errors: {json.dumps(result['errors'], indent=2)}")
+            sys.exit(1)
+        
+        return result
+
+def check_rate_limit(rate_limit: Optional[Dict[str, Any]]):
+    """Defer requests until the GraphQL rate limit resets if the next query would exceed it."""
+    if not rate_limit or rate_limit["remaining"] >= rate_limit["cost"]:
+        return
+    
+    reset_at = datetime.fromisoformat(rate_limit["resetAt"])
+    wait_seconds = max(0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+    print(f"Rate limit nearly exhausted ({rate_limit['remaining']} points left). Waiting {wait_seconds:.0f} seconds for reset...")
+    defer_requests(wait_seconds)
+
+def fetch_all_repositories(owner: str, session: requests.Session, include_forks: bool = True, include_archived: bool = True) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the repositories of the given owner one page at a time.
+    
+    Forks and archived repositories are filtered out by GitHub when excluded.
+    """
+    total_count = 0
+    has_next_page = True
+    after_cursor = None
+    page_count = 0
+    
+    print(f"Fetching repositories for owner: {owner}")
+    
+    while has_next_page:
+        page_count += 1
+        
+        variables = {
+            "login": owner,
+            "after": after_cursor,
+            # null leaves the filter off, false drops matching repositories
+            "isFork": None if include_forks else False,
+            "isArchived": None if include_archived else False,
+        }
+        
+        result = execute_graphql_query(REPOSITORIES_QUERY, variables, session)
+        
+        repo_owner = result.get("data", {}).get("repositoryOwner")
+        if not repo_owner:
+            print(f"Error: No repositories found for owner '{owner}'")
+            sys.exit(1)
+        
+        repositories = repo_owner.get("repositories", {})
+        nodes = repositories.get("nodes", [])
+        page_info = repositories.get("pageInfo", {})
+        
+        total_count += len(nodes)
+        print(f"Fetched page {page_count}: {len(nodes)} repositories (total: {total_count})")
+        yield nodes
+        
+        has_next_page = page_info.get("hasNextPage", False)
+        after_cursor = page_info.get("endCursor")
+        
+        if has_next_page:
+            check_rate_limit(result["data"].get("rateLimit"))
+    
+    print(f"Total repositories fetched: {total_count}")
+
+def format_repository_data(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a single repository for output."""
+    (name, is_private, url, description, created_at, updated_at,
+     pushed_at, stargazer_count, fork_count, disk_usage) = REPO_FIELDS(repo)
+    
+    # Nested objects; owner and repositoryTopics are never null, the rest may be
+    owner_login = repo["owner"]["login"]
+    topics = [t["topic"]["name"] for t in repo["repositoryTopics"]["nodes"]]
+    default_branch_ref = repo["defaultBranchRef"]
+    license_info = repo["licenseInfo"]
+    language = repo["primaryLanguage"]
+    
+    return {
+        "name": name,
+        "full_name": f"{owner_login}/{name}",
+        "owner_login": owner_login,
+        "is_private": is_private,
+        "url": url,
+        "description": description or "",
+        "default_branch": default_branch_ref["name"] if default_branch_ref else "",
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "pushed_at": pushed_at or "",
+        "stargazer_count": stargazer_count,
+        "fork_count": fork_count,
+        "disk_usage": disk_usage,
+        "topics": ",".join(topics),
+        "license": license_info["name"] if license_info else "",
+        "primary_language": language["name"] if language else "",
+    }
+
+def write_reports(pages: Iterable[List[Dict[str, Any]]], json_filename: str, csv_filename: str, pretty_json: bool = False) -> Tuple[int, int]:
+    """Stream pages of repository data to the JSON and CSV reports as they arrive.
+    
+    Returns the total and private repository counts.
+    """
+    total_count = 0
+    private_count = 0
+    
+    with open(json_filename, "wb", buffering=WRITE_BUFFER_SIZE) as json_file, \
+            open(csv_filename, "w", buffering=WRITE_BUFFER_SIZE, newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(CSV_FIELDNAMES)
+        
+        # One repository per line keeps the array valid JSON without holding it in memory
+        json_file.write(b"[")
+        for page in pages:
+            if not page:
+                continue
+            json_file.write(b",\n" if total_count else b"\n")
+            json_file.write(b",\n".join(dumps_json(repo, pretty_json) for repo in page))
+            writer.writerows(map(CSV_ROW, page))
+            total_count += len(page)
+            private_count += sum(repo["is_private"] for repo in page)
+        json_file.write(b"\n]\n" if total_count else b"]\n")
+    
+    print(f"JSON report written to: {json_filename}")
+    print(f"CSV report written to: {csv_filename}")
+    return total_count, private_count
+
+def main():
+    """Main function to generate repository report."""
+    token = os.environ.get("REPORT_TOKEN", "").strip()
+    
+    if token:
+        print("Using authenticated requests (REPORT_TOKEN is set)")
+    else:
+        print("Using unauthenticated requests (REPORT_TOKEN is not set)")
+        print("Only public repositories will be included in the report")
+    
+    include_forks = env_flag("REPORT_INCLUDE_FORKS")
+    include_archived = env_flag("REPORT_INCLUDE_ARCHIVED")
+    pretty_json = env_flag("REPORT_PRETTY_JSON", default=False)
+    if not include_forks:
+        print("Excluding forked repositories (REPORT_INCLUDE_FORKS is false)")
+    if not include_archived:
+        print("Excluding archived repositories (REPORT_INCLUDE_ARCHIVED is false)")
+    
+    # Fetch, format and write repositories page by page
+    try:
+        with create_session(token or None) as session:
+            pages = (
+                [format_repository_data(repo) for repo in nodes]
+                for nodes in fetch_all_repositories(OWNER, session, include_forks, include_archived)
+            )
+            total_count, private_count = write_reports(pages, "repo-report.json", "repo-report.csv", pretty_json)
+    except Exception as e:
+        print(f"Fatal error: {e}")
+        sys.exit(1)
+    
+    print("\nReport generation completed successfully!")
+    print(f"Total repositories: {total_count}")
+    
+    # Print summary statistics
+    public_count = total_count - private_count
+    print(f"  Public: {public_count}")
+    print(f"  Private: {private_count}")
+
+if __name__ == "__main__":
+    main()